@@ -4,13 +4,25 @@ Generate JSON data files for Mission Control dashboard.
 Parses session transcripts, cron jobs, and memory files.
 """
 
+import heapq
 import json
+import mmap
 import os
 import subprocess
+from functools import lru_cache
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime, timedelta
 import re
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple
+
+# orjson is optional: it decodes JSONL several times faster than the stdlib
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    orjson = None
+    _json_loads = json.loads
 
 # Paths
 HOME = Path.home()
@@ -19,104 +31,318 @@ MEMORY_DIR = HOME / "clawd" / "memory"
 MEMORY_FILE = HOME / "clawd" / "MEMORY.md"
 CLAWD_DIR = HOME / "clawd"
 OUTPUT_DIR = Path(__file__).parent / "data"
+SESSION_CACHE_FILE = OUTPUT_DIR / ".session_cache.json"
+# Bump whenever parse_session_file() output changes so stale cache entries are dropped
+SESSION_CACHE_VERSION = 1
+
+# Relative durations like "12m", "2h", "3d" as printed by `openclaw cron list`
+_DURATION_RE = re.compile(r'(\d+)([mhd])')
+_DURATION_UNITS = {'m': 'minutes', 'h': 'hours', 'd': 'days'}
+# Fixed intervals in text schedules: "cron */N ..." (minutes) or "every N[mhd]"
+_SCHEDULE_INTERVAL_RE = re.compile(r'cron\s+\*/(\d+)|every\s+(\d+)([mhd])')
+# Fallback guesses for other text schedules, tried in order (first match wins)
+_SCHEDULE_INTERVAL_TABLE = [
+    (re.compile(r'0 \*'), timedelta(hours=1)),
+    (re.compile(r'0 7|30 8|0 9'), timedelta(days=1)),
+    (re.compile(r'\* \* 1|every week'), timedelta(weeks=1)),
+]
+
+# Schedule field that determines the runs for each schedule kind, with its default
+_SCHEDULE_SPEC_FIELDS = {'at': ('at', ''), 'every': ('everyMs', 0), 'cron': ('expr', '')}
+
+# Cron expression shapes ("minute hour day-of-month month day-of-week") mapped
+# to the interval between runs; tried in order, first match wins, else daily
+_CRON_INTERVAL_PATTERNS = [
+    # Every X minutes: */X * * * *, or within an hour range: */X H1-H2 * * *
+    (re.compile(r'\*/(\d+) (?:\*|[^ ]*-[^ ]*) '), lambda m: timedelta(minutes=int(m.group(1)))),
+    # Every hour: X * * * *
+    (re.compile(r'(?!\*/)[^ ]+ \* '), lambda m: timedelta(hours=1)),
+    # Daily: X Y * * * (multiple hours per day repeat from the first run)
+    (re.compile(r'[^ ]+ [^ ]+ \* \* \*$'), lambda m: timedelta(days=1)),
+    # Weekly: X Y * * Z
+    (re.compile(r'[^ ]+ [^ ]+ \* \* [^ ]+$'), lambda m: timedelta(weeks=1)),
+]
+
+# Script paths in cron payload messages: python3 /path/to/script.py or
+# python3 ~/path/to/script.py, else a shell script; one pass finds either
+_SCRIPT_RE = re.compile(r'python3?\s+(?P<py>~?/[^\s]+\.py)|(?:bash\s+|sh\s+|execute\s+|run\s+)?(?P<sh>~?/[^\s]+\.sh)')
+_PY_SCRIPT_RE = re.compile(r'python3?\s+(~?/[^\s]+\.py)')
+
+# Session files smaller than this are read in one call rather than memory-mapped;
+# below it the mmap setup and page faults cost more than the copy they save
+_MMAP_MIN_SIZE = 1 << 20
+
+# Below this many session files, parse in-process instead of starting a pool
+_POOL_MIN_FILES = 4
+
+# Characters of session text kept per session in the search index
+_INDEX_TEXT_LIMIT = 10000
+
+def _encode_json(obj: Any, indent: bool = True) -> bytes:
+    """Encode `obj` as JSON, with orjson's C encoder when available."""
+    if orjson:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, option=option)
+    if indent:
+        return json.dumps(obj, indent=2).encode()
+    return json.dumps(obj, separators=(',', ':')).encode()
+
+
+def write_json(path: Path, obj: Any, indent: bool = True):
+    """Write `obj` to `path` as JSON."""
+    with open(path, 'wb') as f:
+        f.write(_encode_json(obj, indent))
+
+
+def write_json_array(path: Path, items: Iterable[Any]) -> int:
+    """Stream `items` to `path` as a compact JSON array, encoding one item at a time.
+    
+    The output matches write_json(path, list(items), indent=False), but the items
+    never have to be held in memory together. Returns the number of items written.
+    """
+    count = 0
+    with open(path, 'wb') as f:
+        f.write(b'[')
+        for item in items:
+            if count:
+                f.write(b',')
+            f.write(_encode_json(item, indent=False))
+            count += 1
+        f.write(b']')
+    return count
+
+
+def recent_session_files(limit: int) -> List[Path]:
+    """Return the `limit` most recently modified session files, newest first."""
+    if not SESSIONS_DIR.exists():
+        return []
+    
+    # scandir yields DirEntry objects, so the name/type filter needs no extra syscalls
+    # and each file is stat'ed once; nlargest only keeps `limit` candidates
+    with os.scandir(SESSIONS_DIR) as it:
+        stamped = [(e.stat().st_mtime, e.path) for e in it if e.name.endswith('.jsonl') and e.is_file()]
+    return [Path(path) for _, path in heapq.nlargest(limit, stamped, key=lambda item: item[0])]
 
-def parse_session_file(filepath: Path) -> List[Dict[str, Any]]:
-    """Parse a single JSONL session file and extract activities."""
+
+def _iter_json_lines(buf, needle: Optional[bytes] = None) -> Iterator[Any]:
+    """Yield the decoded JSON objects in `buf` (bytes or mmap), one per line.
+    
+    Lines are found with buf.find (a C memchr) and only the lines that get
+    decoded are copied out. Lines that don't start with '{' or, if `needle` is
+    given, don't contain it are skipped without being copied or decoded.
+    Lines that fail to parse are skipped.
+    """
+    size = len(buf)
+    start = 0
+    while start < size:
+        end = buf.find(b'\n', start)
+        if end < 0:
+            end = size
+        
+        # Every entry is an object, so blank or stray lines are skipped on
+        # their first byte without reaching the decoder
+        if buf[start] == 0x7B and (needle is None or buf.find(needle, start, end) >= 0):
+            try:
+                entry = _json_loads(buf[start:end])
+            except ValueError:
+                pass
+            else:
+                yield entry
+        
+        start = end + 1
+
+
+def _iter_jsonl(filepath: Path, needle: Optional[bytes] = None) -> Iterator[Any]:
+    """Yield the decoded entries of a JSONL file; see _iter_json_lines().
+    
+    Small files are read in one call; larger ones are memory-mapped so the
+    whole file is never copied into a bytes object.
+    """
+    with open(filepath, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return
+        if size < _MMAP_MIN_SIZE:
+            yield from _iter_json_lines(f.read(), needle)
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield from _iter_json_lines(mm, needle)
+
+
+def parse_session_file(filepath: Path) -> Tuple[List[Dict[str, Any]], str]:
+    """Parse a single JSONL session file and extract activities.
+    
+    Also returns the session's message text for the search index, so each
+    session is only read and decoded once.
+    """
+    activities, index_text, _ = _parse_session(filepath)
+    return activities, index_text
+
+
+def _parse_session(filepath: Path) -> Tuple[List[Dict[str, Any]], str, bool]:
+    """parse_session_file(), plus whether the whole file was parsed without error.
+    
+    On error the activities and text found so far are still returned.
+    """
+    session_id = filepath.stem
     activities = []
+    activities_append = activities.append
+    index_parts = []  # joined once at the end, like text_parts below
+    index_len = -1  # length of the joined index text; no separator before the first part
     
     try:
-        with open(filepath, 'r') as f:
-            for line in f:
-                try:
-                    entry = json.loads(line.strip())
-                    
-                    # Extract messages
-                    if entry.get('type') == 'message':
-                        msg = entry.get('message', {})
-                        role = msg.get('role', '')
-                        content_parts = msg.get('content', [])
-                        timestamp = entry.get('timestamp', '')
-                        
-                        if role == 'assistant':
-                            # Extract text content
-                            text_content = ''
-                            tool_calls = []
-                            
-                            for part in content_parts:
-                                if isinstance(part, dict):
-                                    if part.get('type') == 'text':
-                                        text_content += part.get('text', '')
-                                    elif part.get('type') == 'toolCall':
-                                        tool_name = part.get('name', 'unknown')
-                                        args = part.get('arguments', {})
-                                        if isinstance(args, dict):
-                                            if 'command' in args:
-                                                tool_calls.append(f"{tool_name}: {args['command'][:100]}")
-                                            elif 'path' in args:
-                                                tool_calls.append(f"{tool_name}: {args['path']}")
-                                            else:
-                                                tool_calls.append(tool_name)
-                                        else:
-                                            tool_calls.append(tool_name)
-                            
-                            # Add tool calls as activities
-                            for tc in tool_calls:
-                                activities.append({
-                                    'type': 'tool',
-                                    'content': tc,
-                                    'timestamp': timestamp,
-                                    'session': filepath.stem
-                                })
-                            
-                            # Add non-trivial messages
-                            text_content = text_content.strip()
-                            if text_content and len(text_content) > 5:
-                                # Skip empty or very short responses
-                                activities.append({
-                                    'type': 'message',
-                                    'content': text_content[:200] + ('...' if len(text_content) > 200 else ''),
-                                    'timestamp': timestamp,
-                                    'session': filepath.stem
-                                })
-                        
-                        elif role == 'user':
-                            # Extract user messages (for context)
-                            for part in content_parts:
-                                if isinstance(part, dict) and part.get('type') == 'text':
-                                    text = part.get('text', '')[:150]
-                                    if text and 'Telegram' in text:
-                                        # Extract telegram messages
-                                        activities.append({
-                                            'type': 'message',
-                                            'content': f"📨 {text[:200]}",
-                                            'timestamp': timestamp,
-                                            'session': filepath.stem
-                                        })
-                                        
-                except json.JSONDecodeError:
-                    continue
-                    
+        # Message entries always contain the quoted word (as type and as key),
+        # so tool results, thinking blocks etc. are dropped before decoding
+        for entry in _iter_jsonl(filepath, b'"message"'):
+            # Extract messages
+            if entry.get('type') != 'message':
+                continue
+            try:
+                msg = entry['message']
+                content_parts = msg['content']
+            except (KeyError, TypeError):
+                # Malformed entry: nothing to extract
+                continue
+            role = msg.get('role', '')
+            timestamp = entry.get('timestamp', '')
+            
+            if role == 'assistant':
+                # Extract text content (collected in a list and joined once;
+                # str += would copy the accumulated text on every part)
+                text_parts = []
+                
+                for part in content_parts:
+                    # Parts are dicts in practice, so look the type up directly and
+                    # let the rare malformed part fail instead of isinstance-checking all
+                    try:
+                        kind = part['type']
+                    except (TypeError, KeyError):
+                        continue
+                    part_get = part.get
+                    if kind == 'text':
+                        text_parts.append(part_get('text', ''))
+                    elif kind == 'toolCall':
+                        # Add tool calls as activities as soon as they are seen
+                        tool_name = part_get('name', 'unknown')
+                        args = part_get('arguments', {})
+                        if isinstance(args, dict) and 'command' in args:
+                            tool_call = f"{tool_name}: {args['command'][:100]}"
+                        elif isinstance(args, dict) and 'path' in args:
+                            tool_call = f"{tool_name}: {args['path']}"
+                        else:
+                            tool_call = tool_name
+                        activities_append({
+                            'type': 'tool',
+                            'content': tool_call,
+                            'timestamp': timestamp,
+                            'session': session_id
+                        })
+                
+                # Add non-trivial messages
+                text_content = ''.join(text_parts).strip()
+                if text_content and len(text_content) > 5:
+                    # Skip empty or very short responses
+                    activities_append({
+                        'type': 'message',
+                        'content': text_content[:200] + ('...' if len(text_content) > 200 else ''),
+                        'timestamp': timestamp,
+                        'session': session_id
+                    })
+                
+                message_texts = text_parts
+            
+            elif role == 'user':
+                # Extract user messages (for context)
+                message_texts = []
+                for part in content_parts:
+                    try:
+                        kind = part['type']
+                    except (TypeError, KeyError):
+                        continue
+                    if kind != 'text':
+                        continue
+                    text = part.get('text', '')
+                    message_texts.append(text)
+                    # Look for the marker in the first 150 chars without slicing
+                    # every user message; only Telegram ones get copied
+                    if text.find('Telegram', 0, 150) >= 0:
+                        # Extract telegram messages
+                        activities_append({
+                            'type': 'message',
+                            'content': f"📨 {text[:150]}",
+                            'timestamp': timestamp,
+                            'session': session_id
+                        })
+            
+            elif index_len < _INDEX_TEXT_LIMIT:
+                # Other roles only feed the search index
+                message_texts = []
+                for part in content_parts:
+                    try:
+                        kind = part['type']
+                    except (TypeError, KeyError):
+                        continue
+                    if kind == 'text':
+                        message_texts.append(part.get('text', ''))
+            
+            else:
+                # ...so once the index text is full there is nothing left to do
+                continue
+            
+            # Stop collecting index text once the limit is reached instead of
+            # joining the whole session only to truncate it
+            if index_len < _INDEX_TEXT_LIMIT:
+                for text in message_texts:
+                    # Malformed parts (e.g. "text": null) are left out so the
+                    # final join cannot fail outside the try below
+                    if isinstance(text, str):
+                        index_parts.append(text)
+                        index_len += len(text) + 1
+                
     except Exception as e:
         print(f"Error parsing {filepath}: {e}")
+        ok = False
+    else:
+        ok = True
     
-    return activities
+    return activities, '\n'.join(index_parts)[:_INDEX_TEXT_LIMIT], ok
 
 
-def get_cron_jobs() -> List[Dict[str, Any]]:
-    """Get cron jobs from openclaw CLI."""
+def start_cron_list() -> subprocess.Popen:
+    """Launch `openclaw cron list --json` without waiting for it to finish."""
+    return subprocess.Popen(
+        ['openclaw', 'cron', 'list', '--json'],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True
+    )
+
+
+def get_cron_jobs(proc: Optional[subprocess.Popen] = None) -> List[Dict[str, Any]]:
+    """Get cron jobs from openclaw CLI.
+    
+    `proc` is an already running start_cron_list() process to collect;
+    if not given, the command is run here.
+    """
     try:
-        result = subprocess.run(
-            ['openclaw', 'cron', 'list', '--json'],
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
-        if result.returncode == 0:
-            data = json.loads(result.stdout)
+        if proc is None:
+            proc = start_cron_list()
+        try:
+            stdout, _ = proc.communicate(timeout=30)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.communicate()
+            raise
+        
+        if proc.returncode == 0:
+            data = _json_loads(stdout)
             # Handle both list and dict with 'jobs' key
             jobs = data.get('jobs', data) if isinstance(data, dict) else data
             
-            # Calculate next run times for the next 14 days
+            # Calculate next run times for the next 14 days; cached expansions
+            # depend on the current time, so never reuse them across listings
+            _next_runs_cached.cache_clear()
+            fromtimestamp = datetime.fromtimestamp  # local lookup in the job loop
             processed = []
             for job in jobs:
                 schedule = job.get('schedule', {})
@@ -126,7 +352,7 @@ def get_cron_jobs() -> List[Dict[str, Any]]:
                 next_runs = []
                 next_run_ms = state.get('nextRunAtMs')
                 if next_run_ms:
-                    next_run_time = datetime.fromtimestamp(next_run_ms / 1000)
+                    next_run_time = fromtimestamp(next_run_ms / 1000)
                     next_runs = calculate_next_runs_from_schedule(schedule, next_run_time)
                 
                 # Extract model and script from payload
@@ -138,22 +364,19 @@ def get_cron_jobs() -> List[Dict[str, Any]]:
                 message = payload.get('message', '')
                 if message:
                     # Look for common script patterns
-                    import re as re_mod
-                    # Match python3 /path/to/script.py or python3 ~/path/to/script.py
-                    py_match = re_mod.search(r'python3?\s+(~?/[^\s]+\.py)', message)
-                    if py_match:
-                        script = py_match.group(1)
-                    else:
-                        # Match shell scripts
-                        sh_match = re_mod.search(r'(?:bash\s+|sh\s+|execute\s+|run\s+)?(~?/[^\s]+\.sh)', message)
-                        if sh_match:
-                            script = sh_match.group(1)
+                    match = _SCRIPT_RE.search(message)
+                    if match:
+                        script = match.group('py')
+                        if not script:
+                            # A python script later in the message still wins
+                            py_match = _PY_SCRIPT_RE.search(message, match.start())
+                            script = py_match.group(1) if py_match else match.group('sh')
                 
                 # Get last run from state
                 last_run = ''
                 last_run_ms = state.get('lastRunAtMs')
                 if last_run_ms:
-                    last_run = datetime.fromtimestamp(last_run_ms / 1000).isoformat()
+                    last_run = fromtimestamp(last_run_ms / 1000).isoformat()
                 
                 processed.append({
                     'id': job.get('id', ''),
@@ -219,20 +442,10 @@ def parse_cron_text(output: str) -> List[Dict[str, Any]]:
                 next_str = parts[in_idx + 1] if in_idx + 1 < len(parts) else ''
                 next_runs = []
                 
-                if next_str:
-                    now = datetime.now()
-                    if next_str.endswith('m'):
-                        mins = int(next_str[:-1])
-                        next_time = now + timedelta(minutes=mins)
-                        next_runs.append(next_time.isoformat())
-                    elif next_str.endswith('h'):
-                        hours = int(next_str[:-1])
-                        next_time = now + timedelta(hours=hours)
-                        next_runs.append(next_time.isoformat())
-                    elif next_str.endswith('d'):
-                        days = int(next_str[:-1])
-                        next_time = now + timedelta(days=days)
-                        next_runs.append(next_time.isoformat())
+                unit = _DURATION_UNITS.get(next_str[-1:])
+                if unit:
+                    next_time = datetime.now() + timedelta(**{unit: int(next_str[:-1])})
+                    next_runs.append(next_time.isoformat())
                 
                 jobs.append({
                     'id': job_id,
@@ -254,92 +467,98 @@ def parse_cron_text(output: str) -> List[Dict[str, Any]]:
     return jobs
 
 
+def _cron_interval(fields: str) -> timedelta:
+    """Interval between runs for the first five fields of a cron expression"""
+    for pattern, interval in _CRON_INTERVAL_PATTERNS:
+        m = pattern.match(fields)
+        if m:
+            return interval(m)
+    return timedelta(days=1)
+
+
 def calculate_next_runs_from_schedule(schedule: Dict[str, Any], first_run: datetime) -> List[str]:
     """Calculate next run times for a job over the next 14 days based on schedule object."""
-    runs = []
-    now = datetime.now()
-    end_date = now + timedelta(days=14)
-    
     if not schedule:
-        return runs
+        return []
     
+    # Jobs often share a schedule, so expansions are memoized on the fields that matter
     kind = schedule.get('kind', '')
+    field, default = _SCHEDULE_SPEC_FIELDS.get(kind, (None, None))
+    spec = schedule.get(field, default) if field else None
+    return list(_next_runs_cached(kind, spec, first_run))
+
+
+@lru_cache(maxsize=512)
+def _next_runs_cached(kind: str, spec: Any, first_run: datetime) -> Tuple[str, ...]:
+    """Expand a schedule `spec` (the 'at', 'everyMs' or 'expr' value for `kind`).
+    
+    Runs are relative to the current time; get_cron_jobs() clears the cache
+    on every call so entries never outlive a single listing.
+    """
+    runs = []
+    now = datetime.now()
+    end_date = now + timedelta(days=14)
     
     if kind == 'at':
         # One-time job, just add the single run if it's in range
-        at_str = schedule.get('at', '')
+        at_str = spec
         if at_str:
             try:
-                # Parse ISO format like "2026-02-10T02:00:00.000Z"
-                at_time = datetime.fromisoformat(at_str.replace('Z', '+00:00').replace('+00:00', ''))
+                # Parse ISO format like "2026-02-10T02:00:00.000Z", dropping the UTC
+                # suffix so the result stays naive like `now`
+                if at_str.endswith('Z'):
+                    at_str = at_str[:-1]
+                elif at_str.endswith('+00:00'):
+                    at_str = at_str[:-6]
+                at_time = datetime.fromisoformat(at_str)
                 if now <= at_time <= end_date:
                     runs.append(at_time.isoformat())
             except:
                 pass
-        return runs
+        return tuple(runs)
     
     elif kind == 'every':
         # Every X milliseconds
-        every_ms = schedule.get('everyMs', 0)
+        every_ms = spec
         if every_ms > 0:
-            interval = timedelta(milliseconds=every_ms)
-            current = first_run
-            while current < end_date and len(runs) < 100:
-                if current >= now:
-                    runs.append(current.isoformat())
-                current += interval
-        return runs
+            return tuple(_upcoming_runs(first_run, timedelta(milliseconds=every_ms), now, end_date))
+        return ()
     
     elif kind == 'cron':
         # Cron expression - estimate interval from expression
-        expr = schedule.get('expr', '')
+        expr = spec
         if not expr:
-            return runs
+            return ()
         
         parts = expr.split()
         if len(parts) < 5:
-            return runs
+            return ()
         
-        minute, hour, day_of_month, month, day_of_week = parts[:5]
-        
-        # Determine interval based on cron pattern
-        interval = None
-        
-        # Every X minutes pattern: */X * * * *
-        if minute.startswith('*/') and hour == '*':
-            mins = int(minute[2:])
-            interval = timedelta(minutes=mins)
-        # Minute interval with hour range: */X H1-H2 * * *
-        elif minute.startswith('*/') and '-' in hour:
-            mins = int(minute[2:])
-            interval = timedelta(minutes=mins)
-        # Every hour: 0 * * * * or X * * * *
-        elif hour == '*' and not minute.startswith('*/'):
-            interval = timedelta(hours=1)
-        # Daily: X Y * * *
-        elif day_of_month == '*' and month == '*' and day_of_week == '*':
-            if ',' in hour:
-                # Multiple times per day - use first run and repeat daily
-                interval = timedelta(days=1)
-            else:
-                interval = timedelta(days=1)
-        # Weekly: X Y * * Z
-        elif day_of_month == '*' and month == '*' and day_of_week != '*':
-            interval = timedelta(weeks=1)
-        else:
-            # Default to daily
-            interval = timedelta(days=1)
+        interval = _cron_interval(' '.join(parts[:5]))
         
         # Generate runs
-        current = first_run
-        while current < end_date and len(runs) < 100:
-            if current >= now:
-                runs.append(current.isoformat())
-            current += interval
-        
-        return runs
+        return tuple(_upcoming_runs(first_run, interval, now, end_date))
     
-    return runs
+    return ()
+
+
+def _upcoming_runs(first_run: datetime, interval: timedelta, now: datetime, end: datetime,
+                   limit: int = 100) -> List[str]:
+    """ISO times of the runs on `first_run`'s `interval` grid in [now, end), at most `limit`."""
+    if first_run < now:
+        # Jump straight to the first run at or after now (ceiling division)
+        first_run += interval * -((first_run - now) // interval)
+    return _interval_runs(first_run, interval, end, limit)
+
+
+def _interval_runs(start: datetime, interval: timedelta, end: datetime, limit: int) -> List[str]:
+    """ISO times of `start`, `start + interval`, ... before `end`, at most `limit` of them."""
+    if start >= end or limit <= 0:
+        return []
+    
+    # The count comes from one integer (microsecond) division instead of a compare per step
+    count = min(limit, (end - start - timedelta(microseconds=1)) // interval + 1)
+    return [(start + interval * i).isoformat() for i in range(count)]
 
 
 def calculate_next_runs(schedule: str, next_run: str) -> List[str]:
@@ -354,122 +573,190 @@ def calculate_next_runs(schedule: str, next_run: str) -> List[str]:
                 time_str = next_run[3:].strip()
                 now = datetime.now()
                 
-                match = re.match(r'(\d+)([mhd])', time_str)
+                match = _DURATION_RE.match(time_str)
                 if match:
-                    val = int(match.group(1))
-                    unit = match.group(2)
-                    
-                    if unit == 'm':
-                        next_time = now + timedelta(minutes=val)
-                    elif unit == 'h':
-                        next_time = now + timedelta(hours=val)
-                    elif unit == 'd':
-                        next_time = now + timedelta(days=val)
-                    else:
-                        next_time = now
-                    
+                    val, unit = match.groups()
+                    next_time = now + timedelta(**{_DURATION_UNITS[unit]: int(val)})
                     runs.append(next_time.isoformat())
                     
                     # For recurring jobs, add more occurrences
                     if 'cron' in schedule or 'every' in schedule:
                         # Estimate interval
-                        if '*/30' in schedule or 'every 30m' in schedule:
-                            interval = timedelta(minutes=30)
-                        elif '*/15' in schedule or 'every 15m' in schedule:
-                            interval = timedelta(minutes=15)
-                        elif '0 *' in schedule or 'every 1h' in schedule:
-                            interval = timedelta(hours=1)
-                        elif '0 7' in schedule or '30 8' in schedule or '0 9' in schedule:
-                            interval = timedelta(days=1)
-                        elif '* * 1' in schedule or 'every week' in schedule:
-                            interval = timedelta(weeks=1)
+                        interval_match = _SCHEDULE_INTERVAL_RE.search(schedule)
+                        if interval_match:
+                            step_mins, every_val, every_unit = interval_match.groups()
+                            if step_mins:
+                                interval = timedelta(minutes=int(step_mins))
+                            else:
+                                interval = timedelta(**{_DURATION_UNITS[every_unit]: int(every_val)})
                         else:
-                            interval = timedelta(days=1)
+                            interval = next(
+                                (iv for pattern, iv in _SCHEDULE_INTERVAL_TABLE if pattern.search(schedule)),
+                                timedelta(days=1)
+                            )
                         
                         # Add runs for next 14 days
-                        current = next_time + interval
                         end_date = now + timedelta(days=14)
-                        while current < end_date and len(runs) < 50:
-                            runs.append(current.isoformat())
-                            current += interval
+                        runs.extend(_interval_runs(next_time + interval, interval, end_date, 50 - len(runs)))
         except Exception as e:
             print(f"Error calculating runs for {schedule}: {e}")
     
     return runs
 
 
-def build_search_index() -> List[Dict[str, Any]]:
-    """Build search index from memory files and sessions."""
-    index = []
+def parse_sessions(session_files: List[Path], parse=parse_session_file) -> List[Any]:
+    """Run `parse` (parse_session_file() by default) over `session_files` in
+    parallel, preserving order."""
+    # A handful of files (e.g. the few that changed since the cached run)
+    # parse faster than worker processes start up
+    if len(session_files) < _POOL_MIN_FILES:
+        return [parse(sf) for sf in session_files]
+    
+    workers = min(os.cpu_count() or 1, len(session_files))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(parse, session_files, chunksize=4))
+
+
+def load_session_cache() -> Dict[str, Any]:
+    """Load the session parse cache from the previous run; empty if missing, unreadable
+    or written for a different SESSION_CACHE_VERSION."""
+    try:
+        cache = _json_loads(SESSION_CACHE_FILE.read_bytes())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cache, dict) or cache.get('version') != SESSION_CACHE_VERSION:
+        return {}
+    sessions = cache.get('sessions')
+    return sessions if isinstance(sessions, dict) else {}
+
+
+def save_session_cache(cache: Dict[str, Any]):
+    """Persist the session parse cache for the next run."""
+    try:
+        write_json(SESSION_CACHE_FILE, {'version': SESSION_CACHE_VERSION, 'sessions': cache}, indent=False)
+    except OSError as e:
+        print(f"Error writing session cache: {e}")
+
+
+def parse_sessions_cached(session_files: List[Path]) -> List[Tuple[List[Dict[str, Any]], str]]:
+    """Like parse_sessions(), but reuse results for files unchanged since the last run.
+    
+    Files are keyed on path, mtime and size; only new or modified sessions
+    are parsed again. The cache is rewritten with just the current files that
+    parsed cleanly, so a failed read is retried on the next run.
+    """
+    cache = load_session_cache()
+    fresh = {}
+    results = {}
+    stale = []
+    
+    for sf in session_files:
+        try:
+            st = sf.stat()
+        except OSError as e:
+            # Renamed or deleted since it was listed: skip it
+            print(f"Error parsing {sf}: {e}")
+            continue
+        cached = cache.get(str(sf))
+        if isinstance(cached, dict) and cached.get('mtimeNs') == st.st_mtime_ns and cached.get('size') == st.st_size:
+            fresh[str(sf)] = results[str(sf)] = cached
+        else:
+            stale.append((sf, st))
+    
+    parsed = parse_sessions([sf for sf, _ in stale], _parse_session)
+    for (sf, st), (activities, index_text, ok) in zip(stale, parsed):
+        results[str(sf)] = {
+            'mtimeNs': st.st_mtime_ns,
+            'size': st.st_size,
+            'activities': activities,
+            'indexText': index_text
+        }
+        if ok:
+            fresh[str(sf)] = results[str(sf)]
+    
+    save_session_cache(fresh)
+    skipped = {'activities': [], 'indexText': ''}
+    return [(entry['activities'], entry['indexText'])
+            for entry in (results.get(str(sf), skipped) for sf in session_files)]
+
+
+def _read_text_file(path: Path) -> Optional[str]:
+    """Read a text file for the search index, or None if it can't be read."""
+    try:
+        # One raw read and one decode, without TextIOWrapper's newline translation
+        return path.read_bytes().decode('utf-8', 'replace')
+    except Exception as e:
+        print(f"Error reading {path}: {e}")
+        return None
+
+
+# (file label, type, pending file content) for one memory/notes document
+MarkdownRead = Tuple[str, str, "Future[Optional[str]]"]
+
+
+def start_markdown_reads(executor: ThreadPoolExecutor) -> List[MarkdownRead]:
+    """Submit reads of the memory and notes files to `executor`.
+    
+    Returns the pending reads in index order, so they can run in the
+    background until build_search_index() needs them.
+    """
+    # Collect memory and notes files as (path, file label, type)
+    md_files = []
     
     # Index memory files
     if MEMORY_DIR.exists():
         for md_file in MEMORY_DIR.glob("*.md"):
-            try:
-                content = md_file.read_text()
-                index.append({
-                    'file': f"memory/{md_file.name}",
-                    'type': 'memory',
-                    'content': content
-                })
-            except Exception as e:
-                print(f"Error reading {md_file}: {e}")
+            md_files.append((md_file, f"memory/{md_file.name}", 'memory'))
     
     # Index main MEMORY.md
     if MEMORY_FILE.exists():
-        try:
-            content = MEMORY_FILE.read_text()
-            index.append({
-                'file': 'MEMORY.md',
-                'type': 'memory',
-                'content': content
-            })
-        except Exception as e:
-            print(f"Error reading MEMORY.md: {e}")
+        md_files.append((MEMORY_FILE, 'MEMORY.md', 'memory'))
     
     # Index other .md files in clawd
     for md_file in CLAWD_DIR.glob("*.md"):
         if md_file.name == 'MEMORY.md':
             continue
-        try:
-            content = md_file.read_text()
-            index.append({
-                'file': md_file.name,
-                'type': 'notes',
+        md_files.append((md_file, md_file.name, 'notes'))
+    
+    # Reads are pure I/O waits, so overlap them on a few threads
+    return [(label, doc_type, executor.submit(_read_text_file, md_file)) for md_file, label, doc_type in md_files]
+
+
+def build_search_index(session_texts: Optional[List[Tuple[Path, str]]] = None,
+                       markdown_reads: Optional[List[MarkdownRead]] = None) -> Iterator[Dict[str, Any]]:
+    """Build search index from memory files and sessions.
+    
+    Documents are yielded one at a time so they can be streamed to disk.
+    `session_texts` pairs session files with the text returned by
+    parse_session_file(); defaults to parsing the 20 most recent sessions.
+    `markdown_reads` comes from start_markdown_reads(); by default the
+    memory files are read here.
+    """
+    if markdown_reads is None:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            markdown_reads = start_markdown_reads(executor)
+    
+    for label, doc_type, future in markdown_reads:
+        content = future.result()
+        if content is not None:
+            yield {
+                'file': label,
+                'type': doc_type,
                 'content': content
-            })
-        except Exception as e:
-            print(f"Error reading {md_file}: {e}")
+            }
     
     # Index recent sessions (last 20)
-    if SESSIONS_DIR.exists():
-        session_files = sorted(SESSIONS_DIR.glob("*.jsonl"), key=lambda p: p.stat().st_mtime, reverse=True)[:20]
-        
-        for sf in session_files:
-            try:
-                content_parts = []
-                with open(sf, 'r') as f:
-                    for line in f:
-                        try:
-                            entry = json.loads(line)
-                            if entry.get('type') == 'message':
-                                msg = entry.get('message', {})
-                                for part in msg.get('content', []):
-                                    if isinstance(part, dict) and part.get('type') == 'text':
-                                        content_parts.append(part.get('text', ''))
-                        except:
-                            continue
-                
-                if content_parts:
-                    index.append({
-                        'file': f"session/{sf.stem[:8]}...",
-                        'type': 'session',
-                        'content': '\n'.join(content_parts)[:10000]  # Limit size
-                    })
-            except Exception as e:
-                print(f"Error indexing session {sf}: {e}")
+    if session_texts is None:
+        session_files = recent_session_files(20)
+        session_texts = [(sf, text) for sf, (_, text) in zip(session_files, parse_sessions(session_files))]
     
-    return index
+    for sf, text in session_texts:
+        if text:
+            yield {
+                'file': f"session/{sf.stem[:8]}...",
+                'type': 'session',
+                'content': text
+            }
 
 
 def main():
@@ -478,40 +765,48 @@ def main():
     # Create output directory
     OUTPUT_DIR.mkdir(exist_ok=True)
     
+    # Start listing cron jobs now so it runs while sessions are parsed
+    try:
+        cron_proc = start_cron_list()
+    except OSError:
+        cron_proc = None  # get_cron_jobs() retries and reports the error
+    
     # Parse session files
     print("📊 Parsing session files...")
     all_activities = []
+    session_texts = []
+    session_files = recent_session_files(30)
     
-    if SESSIONS_DIR.exists():
-        session_files = sorted(SESSIONS_DIR.glob("*.jsonl"), key=lambda p: p.stat().st_mtime, reverse=True)[:30]
-        
-        for sf in session_files:
-            activities = parse_session_file(sf)
-            all_activities.extend(activities)
-    
-    # Sort by timestamp
-    all_activities.sort(key=lambda x: x.get('timestamp', ''), reverse=True)
-    
-    # Write activity data
-    with open(OUTPUT_DIR / 'activity.json', 'w') as f:
-        json.dump(all_activities[:500], f, indent=2)
-    print(f"  → {len(all_activities)} activities found")
+    for sf, (activities, index_text) in zip(session_files, parse_sessions_cached(session_files)):
+        all_activities.extend(activities)
+        session_texts.append((sf, index_text))
     
-    # Get cron jobs
-    print("📅 Getting cron jobs...")
-    cron_jobs = get_cron_jobs()
-    
-    with open(OUTPUT_DIR / 'cron.json', 'w') as f:
-        json.dump(cron_jobs, f, indent=2)
-    print(f"  → {len(cron_jobs)} cron jobs found")
-    
-    # Build search index
-    print("🔍 Building search index...")
-    search_index = build_search_index()
-    
-    with open(OUTPUT_DIR / 'search-index.json', 'w') as f:
-        json.dump(search_index, f, indent=2)
-    print(f"  → {len(search_index)} documents indexed")
+    # Read memory files in the background while the remaining output is written
+    # and the cron listing is awaited (after the session pool has forked, so its
+    # workers don't inherit running threads)
+    with ThreadPoolExecutor(max_workers=8) as io_executor:
+        markdown_reads = start_markdown_reads(io_executor)
+        
+        # Sort by timestamp
+        all_activities.sort(key=lambda x: x.get('timestamp', ''), reverse=True)
+        
+        # Write activity data
+        write_json(OUTPUT_DIR / 'activity.json', all_activities[:500])
+        print(f"  → {len(all_activities)} activities found")
+        
+        # Get cron jobs
+        print("📅 Getting cron jobs...")
+        cron_jobs = get_cron_jobs(cron_proc)
+        
+        write_json(OUTPUT_DIR / 'cron.json', cron_jobs)
+        print(f"  → {len(cron_jobs)} cron jobs found")
+        
+        # Build search index
+        print("🔍 Building search index...")
+        search_index = build_search_index(session_texts[:20], markdown_reads)
+        # Only the dashboard reads the index, so skip the indentation on this big file
+        indexed = write_json_array(OUTPUT_DIR / 'search-index.json', search_index)
+    print(f"  → {indexed} documents indexed")
     
     print("✅ Data generation complete!")
     print(f"   Output: {OUTPUT_DIR}")